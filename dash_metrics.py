@@ -1,15 +1,27 @@
-import io
+import base64
+import json
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import plotly.graph_objects as go
 import plotly.io as pio
 import dash
-from dash import dcc, html, Input, Output, State
+from dash import dcc, html, ctx, Input, Output, State, Patch
+from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
+from numba import njit
 import glob
 import os
+import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 pio.templates.default = "plotly_white"
+# Dash serializes callback outputs through plotly's JSON encoder, so this also covers figures sent to the browser
+pio.json.config.default_engine = "orjson"
 
 palette = [
     "rgba(242, 128, 137, 1)",
@@ -19,23 +31,312 @@ palette = [
     "rgba(242, 173, 113, 1)"
 ]
 
+# Columns read from the run files and the types they are narrowed to on read; anything else in
+# the parquet is left on disk. Costs are i32 in the solver, so 32 bits hold every value exactly.
+plot_columns = {
+    'iteration': pa.int32(),
+    'candidate_cost': pa.int32(),
+    'candidate_seen': pa.int32(),
+    'incumbent_cost': pa.int32(),
+    'best_cost': pa.int32(),
+    'evaluations': pa.int32()
+}
+
+# Points kept per trace after downsampling; more than a plot can show at full width
+max_plot_points = 2000
+
+# Iteration x cost bins for the candidate cost density
+candidate_bins = [400, 200]
+
+# Columns aggregated into per-iteration min/max bands across runs
+min_max_columns = ['incumbent_cost', 'candidate_cost', 'best_cost']
+
+# Per-run line traces in drawing order; the last two go on the secondary y-axis
+line_traces = [
+    dict(column='incumbent_cost', name='Incumbent Cost', color=palette[0]),
+    dict(column='best_cost', name='Best Cost', color=palette[2]),
+    dict(column='candidate_seen', name='Seen', color=palette[1], opacity=0.3, yaxis='y2'),
+    dict(column='evaluations', name='Evaluations', color=palette[2], opacity=0.3, yaxis='y2')
+]
+
+# Combined frames and min/max stats per prefix, keyed on the (file, mtime) listing they were built from.
+_prefix_cache: dict[str, tuple[tuple, tuple[pd.DataFrame, dict[int, pd.DataFrame]]]] = {}
+_min_max_cache: dict[str, tuple[tuple, pd.DataFrame]] = {}
+
+# One lock per cache and prefix, so the callbacks fired together by a prefix change wait for a
+# single build instead of each loading the same files.
+_prefix_locks: dict[tuple[str, str], threading.Lock] = {}
+_prefix_locks_guard = threading.Lock()
+
+def _prefix_lock(cache: str, input_file_prefix: str) -> threading.Lock:
+    with _prefix_locks_guard:
+        return _prefix_locks.setdefault((cache, input_file_prefix), threading.Lock())
+
+def _files_signature(all_files: list[str]) -> tuple:
+    """Identifies a set of run files by name and modification time."""
+    return tuple((file, os.path.getmtime(file)) for file in sorted(all_files))
+
+# Run number suffix of a run file, e.g. annealing_Call_7_Vehicle_3_004.parquet
+_run_number_pattern = re.compile(r"_(\d+)\.parquet$")
+
+def _find_files(input_file_prefix: str) -> list[str]:
+    return glob.glob(f"instrumentation/annealing_{input_file_prefix}_*.parquet")
+
+def _read_run(file: str) -> tuple[int, pa.Table]:
+    """Reads the plotted columns of one run file, along with the run number from its filename."""
+    parquet_file = pq.ParquetFile(file)
+    columns = [column for column in plot_columns if column in parquet_file.schema_arrow.names]
+    run_number = int(_run_number_pattern.search(file).group(1))
+    table = parquet_file.read(columns=columns, use_threads=True)
+    return run_number, table.cast(pa.schema([(column, plot_columns[column]) for column in columns]))
+
+def _append_runs(previous, runs: list[tuple[int, pa.Table]]):
+    """Appends freshly read runs to a previously combined frame and its per-run views, if any."""
+    new_runs = np.array([run_number for run_number, _ in runs], dtype=np.int16)
+    tables = [table for _, table in runs]
+    new_lengths = [table.num_rows for table in tables]
+
+    # Keep the columns every run has
+    columns = [column for column in plot_columns if all(column in table.column_names for table in tables)]
+    run_numbers, run_lengths = list(new_runs), new_lengths
+    if previous is not None:
+        previous_df, previous_groups = previous
+        columns = [column for column in columns if column in previous_df.columns]
+        run_numbers = list(previous_groups) + run_numbers
+        run_lengths = [len(group) for group in previous_groups.values()] + run_lengths
+
+    # Concatenate column by column into a single allocation each. The new chunks are viewed
+    # in place, so that allocation is the only copy out of the Arrow buffers.
+    combined = {}
+    for column in columns:
+        parts = [chunk.to_numpy(zero_copy_only=True) for table in tables for chunk in table.column(column).chunks]
+        if previous is not None:
+            parts.insert(0, previous_df[column].to_numpy())
+        combined[column] = np.concatenate(parts)
+    parts = [np.repeat(new_runs, new_lengths)]
+    if previous is not None:
+        parts.insert(0, previous_df['run'].to_numpy())
+    combined['run'] = np.concatenate(parts)
+    combined_df = pd.DataFrame(combined, copy=False)
+
+    # Runs are laid out back to back, so each one is a contiguous slice of the combined frame
+    offsets = np.cumsum([0] + run_lengths)
+    run_groups = {int(run_number): combined_df.iloc[start:stop]
+                  for run_number, start, stop in zip(run_numbers, offsets[:-1], offsets[1:])}
+    return combined_df, run_groups
+
 def load_data(input_file_prefix: str):
-    """Loads and combines data from all runs for a given prefix."""
-    all_files = glob.glob(f"instrumentation/annealing_{input_file_prefix}_*.parquet")
+    """Loads and combines data from all runs for a given prefix.
+
+    Returns the combined frame together with a view of it per run number. Both are cached;
+    when files are only added, just the new runs are read and appended, and any other change
+    to the run files rebuilds the frame from scratch.
+    """
+    all_files = _find_files(input_file_prefix)
     if not all_files:
         print(f"No files found for prefix: {input_file_prefix}")
         return None
 
-    all_data = []
-    for file in all_files:
-        df = pd.read_parquet(file)
-        # Extract run number from filename
-        run_number = int(os.path.splitext(os.path.basename(file))[0].split("_")[-1])
-        df['run'] = run_number  # Add run number as a column
-        all_data.append(df)
+    with _prefix_lock('data', input_file_prefix):
+        signature = _files_signature(all_files)
+        cached = _prefix_cache.get(input_file_prefix)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        previous = None
+        new_files = [file for file, _ in signature]
+        if cached is not None and set(cached[0]) <= set(signature):
+            previous = cached[1]
+            seen = {file for file, _ in cached[0]}
+            new_files = [file for file in new_files if file not in seen]
+
+        with ThreadPoolExecutor(max_workers=min(len(new_files), os.cpu_count() or 1)) as executor:
+            runs = list(executor.map(_read_run, new_files))
+
+        data = _append_runs(previous, runs)
+        _prefix_cache[input_file_prefix] = (signature, data)
+        return data
+
+def _downsample(x: pd.Series, y: pd.Series, x_range=None,
+                n_out: int = max_plot_points) -> tuple[np.ndarray, np.ndarray]:
+    """Picks at most n_out points of a series with Largest-Triangle-Three-Buckets.
+
+    With an x_range, only the points inside that window (plus one on either side, so lines run
+    to the plot edges) are considered, which gives zoomed views their full resolution back.
+    The first and last points are always kept. Every bucket in between contributes the point
+    spanning the largest triangle with the previously kept point and the mean of the next bucket,
+    which preserves peaks and the overall shape of the line.
+    """
+    x = x.to_numpy()
+    y = y.to_numpy()
+    if x_range is not None:
+        start = max(int(np.searchsorted(x, x_range[0], side='left')) - 1, 0)
+        stop = int(np.searchsorted(x, x_range[1], side='right')) + 1
+        x = x[start:stop]
+        y = y[start:stop]
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return x, y
+
+    xf = x.astype(np.float64)
+    yf = y.astype(np.float64)
+    edges = (np.arange(n_out - 1) * ((n - 2) / (n_out - 2))).astype(np.int64) + 1
+    edges[-1] = n - 1
+
+    # Mean of every bucket up front, the last point being a bucket of its own
+    counts = np.diff(np.append(edges, n))
+    avg_x = np.add.reduceat(xf, edges) / counts
+    avg_y = np.add.reduceat(yf, edges) / counts
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    _lttb_select(xf, yf, edges, avg_x, avg_y, selected)
+
+    return x[selected], y[selected]
+
+def _band_xy(min_max_stats: pd.DataFrame, x_range=None) -> tuple[np.ndarray, np.ndarray]:
+    """Incumbent cost min/max band as one closed polygon: along the minimum, back along the maximum."""
+    x_min, y_min = _downsample(min_max_stats['iteration'], min_max_stats['incumbent_cost_min'], x_range)
+    x_max, y_max = _downsample(min_max_stats['iteration'], min_max_stats['incumbent_cost_max'], x_range)
+    return np.concatenate([x_min, x_max[::-1]]), np.concatenate([y_min, y_max[::-1]])
+
+def _line_trace(df_run: pd.DataFrame, spec: dict, x_range=None) -> go.Scattergl:
+    """Builds the downsampled line trace for one entry of line_traces."""
+    x, y = _downsample(df_run['iteration'], df_run[spec['column']], x_range)
+    return go.Scattergl(
+        x=x,
+        y=y,
+        mode='lines',
+        name=spec['name'],
+        legendgroup=spec['column'],
+        yaxis=spec.get('yaxis', 'y'),
+        line=dict(color=spec['color']),
+        opacity=spec.get('opacity', 1),
+        hovertemplate='%{y:,.0f}<extra></extra>'
+    )
+
+def _relayout_x_range(relayout_data):
+    """The x window a relayout event moved to, as (changed, [start, end] or None for the full run)."""
+    if relayout_data and 'xaxis.range[0]' in relayout_data and 'xaxis.range[1]' in relayout_data:
+        return True, [relayout_data['xaxis.range[0]'], relayout_data['xaxis.range[1]']]
+    if relayout_data and 'xaxis.range' in relayout_data:
+        return True, list(relayout_data['xaxis.range'])
+    if relayout_data and relayout_data.get('xaxis.autorange'):
+        return True, None
+    return False, None
+
+@njit(cache=True)
+def _lttb_select(x, y, edges, avg_x, avg_y, selected):
+    """Fills selected[1:-1] with the LTTB pick of each bucket x[edges[b]:edges[b + 1]]."""
+    a = 0
+    for bucket in range(len(selected) - 2):
+        best_area = -1.0
+        best = edges[bucket]
+        for i in range(edges[bucket], edges[bucket + 1]):
+            area = abs((x[a] - avg_x[bucket + 1]) * (y[i] - y[a]) - (x[a] - x[i]) * (avg_y[bucket + 1] - y[a]))
+            if area > best_area:
+                best_area = area
+                best = i
+        a = best
+        selected[bucket + 1] = a
+
+# Not parallel=True: this runs on Dash's request threads, and Numba's parallel backends either abort on
+# concurrent calls (workqueue) or hang at shutdown when called off the main thread (tbb).
+@njit(cache=True)
+def _rollup_min_max(values, bounds, out_min, out_max):
+    """Writes the min and max of each group values[bounds[g]:bounds[g + 1]] into out_min/out_max."""
+    for group in range(len(bounds) - 1):
+        low = values[bounds[group]]
+        high = low
+        for i in range(bounds[group] + 1, bounds[group + 1]):
+            value = values[i]
+            if value < low:
+                low = value
+            if value > high:
+                high = value
+        out_min[group] = low
+        out_max[group] = high
+
+# Schema metadata key holding the run file signature a min/max sidecar was built from
+_signature_key = b'drones2.signature'
+
+def _min_max_path(input_file_prefix: str) -> str:
+    return f"instrumentation/minmax_{input_file_prefix}.parquet"
+
+def _read_sidecar(sidecar: str, sidecar_signature: bytes):
+    """The stats in a min/max sidecar, or None when it is missing, stale or unreadable."""
+    try:
+        if not os.path.exists(sidecar):
+            return None
+        if (pq.read_schema(sidecar).metadata or {}).get(_signature_key) != sidecar_signature:
+            return None
+        return pd.read_parquet(sidecar)
+    except (OSError, pa.ArrowInvalid) as error:
+        print(f"Ignoring unreadable min/max sidecar {sidecar}: {error}")
+        return None
+
+def _write_sidecar(sidecar: str, sidecar_signature: bytes, min_max_stats: pd.DataFrame):
+    """Writes a min/max sidecar through a temporary file, so an interrupted write never replaces a good one.
+
+    Failures are only reported; the stats are still usable from memory.
+    """
+    table = pa.Table.from_pandas(min_max_stats, preserve_index=False)
+    table = table.replace_schema_metadata({**table.schema.metadata, _signature_key: sidecar_signature})
+    temp_path = None
+    try:
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(sidecar), prefix='.minmax_', suffix='.parquet.tmp')
+        os.close(fd)
+        pq.write_table(table, temp_path)
+        os.replace(temp_path, sidecar)
+    except (OSError, pa.ArrowException) as error:
+        print(f"Could not write min/max sidecar {sidecar}: {error}")
+        if temp_path is not None and os.path.exists(temp_path):
+            os.remove(temp_path)
+
+def load_min_max(input_file_prefix: str):
+    """Per-iteration min/max across all runs for a given prefix.
+
+    Cached in memory and in a parquet sidecar next to the run files. The sidecar records the
+    (file, mtime) listing it was built from and is only reused while that listing is unchanged.
+    """
+    all_files = _find_files(input_file_prefix)
+    if not all_files:
+        return None
+
+    with _prefix_lock('min_max', input_file_prefix):
+        signature = _files_signature(all_files)
+        cached = _min_max_cache.get(input_file_prefix)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        sidecar = _min_max_path(input_file_prefix)
+        sidecar_signature = json.dumps(signature).encode()
+        min_max_stats = _read_sidecar(sidecar, sidecar_signature)
+        if min_max_stats is None:
+            data = load_data(input_file_prefix)
+            if data is None:
+                return None
+            df, _ = data
+
+            # Calculate min/max across ALL runs: sort by iteration once, then reduce each contiguous group
+            iterations = df['iteration'].to_numpy()
+            order = np.argsort(iterations, kind='stable')
+            iterations = iterations[order]
+            starts = np.flatnonzero(np.r_[True, iterations[1:] != iterations[:-1]])
+            bounds = np.append(starts, len(iterations))
 
-    combined_df = pd.concat(all_data, ignore_index=True)
-    return combined_df
+            stats = {'iteration': iterations[starts]}
+            for column in min_max_columns:
+                values = np.ascontiguousarray(df[column].to_numpy()[order])
+                stats[f'{column}_min'] = np.empty(len(starts), dtype=values.dtype)
+                stats[f'{column}_max'] = np.empty(len(starts), dtype=values.dtype)
+                _rollup_min_max(values, bounds, stats[f'{column}_min'], stats[f'{column}_max'])
+            min_max_stats = pd.DataFrame(stats)
+            _write_sidecar(sidecar, sidecar_signature, min_max_stats)
+
+        _min_max_cache[input_file_prefix] = (signature, min_max_stats)
+        return min_max_stats
 
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.LUX])
 
@@ -101,8 +402,10 @@ app.layout = dbc.Container([
         ], width=12)
     ]),
 
-    # Hidden div to store pre-calculated min/max data
-    html.Div(id='min-max-data', style={'display': 'none'})
+    # Browser-side store for pre-calculated min/max data
+    dcc.Store(id='min-max-data', storage_type='memory'),
+    # x window currently drawn at full resolution, None for the whole run
+    dcc.Store(id='plot-window', storage_type='memory')
 ], fluid=True, className="p-0")
 
 @app.callback(
@@ -112,9 +415,10 @@ app.layout = dbc.Container([
     Input('file-prefix-dropdown', 'value')
 )
 def update_slider(selected_prefix):
-    df = load_data(selected_prefix)
-    if df is not None:
-        runs = sorted(df['run'].unique())
+    data = load_data(selected_prefix)
+    if data is not None:
+        _, run_groups = data
+        runs = sorted(run_groups)
         min_run = min(runs)
         max_run = max(runs)
         marks = {int(run): str(run) for run in runs}  # Ensure marks are integers
@@ -123,123 +427,79 @@ def update_slider(selected_prefix):
 
 # Callback to pre-calculate min/max data
 @app.callback(
-    Output('min-max-data', 'children'),
+    Output('min-max-data', 'data'),
     Input('file-prefix-dropdown', 'value')
 )
 def calculate_min_max(selected_prefix):
-    df = load_data(selected_prefix)
-    if df is None:
+    min_max_stats = load_min_max(selected_prefix)
+    if min_max_stats is None:
         return None
-
-    # Calculate min/max across ALL runs
-    min_max_stats = df.groupby('iteration').agg({
-        'incumbent_cost': ['min', 'max'],
-        'candidate_cost': ['min', 'max'],
-        'best_cost': ['min', 'max']
-    })
-    min_max_stats.columns = ['_'.join(col).strip() for col in min_max_stats.columns.values]
-    min_max_stats = min_max_stats.reset_index()
-    return min_max_stats.to_json(date_format='iso', orient='split')
+    # Shipped to the store as a base64 Arrow IPC stream, which decodes without parsing. Only the drawn
+    # band goes to the browser; the plot callbacks read the full stats from the server-side cache.
+    table = pa.Table.from_pandas(min_max_stats[['iteration', 'incumbent_cost_min', 'incumbent_cost_max']],
+                                 preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return base64.b64encode(sink.getvalue().to_pybytes()).decode('ascii')
 
 # Callback to update the plot
 @app.callback(
     Output('metric-plot', 'figure'),
+    Output('plot-window', 'data'),
     Input('file-prefix-dropdown', 'value'),
     Input('run-slider', 'value'),
     Input('show-bands-checklist', 'value'),
-    Input('metric-plot', 'relayoutData'),
-    State('min-max-data', 'children')
+    State('plot-window', 'data')
 )
-def update_plot(selected_prefix, selected_run, show_bands, relayout_data, min_max_data_json):
-    df = load_data(selected_prefix)
-    if df is None or min_max_data_json is None:
-        return go.Figure()
+def update_plot(selected_prefix, selected_run, show_bands, window):
+    # The zoom survives run and band changes (see uirevision below), so keep drawing that window;
+    # a new instance starts over at the full run.
+    x_range = window if ctx.triggered_id in ('run-slider', 'show-bands-checklist') else None
 
-    # Filter data for the selected run
-    df_run = df[df['run'] == selected_run]
-    fig = go.Figure()
+    data = load_data(selected_prefix)
+    if data is None:
+        return go.Figure(), x_range
+
+    _, run_groups = data
+    df_run = run_groups.get(selected_run)
+    if df_run is None:
+        return go.Figure(), x_range
 
     # Left y-axis
-    fig.add_trace(go.Scatter(
-        x=df_run['iteration'],
-        y=df_run['candidate_cost'],
-        mode='lines',
+    # Candidates are drawn as a density cloud, binned here instead of shipping every point
+    counts, x_edges, y_edges = np.histogram2d(df_run['iteration'], df_run['candidate_cost'],
+                                              bins=candidate_bins)
+    traces = [go.Heatmap(
+        z=np.where(counts > 0, counts, np.nan).T.astype(np.float32),
+        x=x_edges,
+        y=y_edges,
         name='Candidate Cost',
         legendgroup='candidate_cost',
-        line=dict(color=palette[3]),
-        opacity=0.2,
-        hovertemplate='%{y:,.0f}<extra></extra>'
-    ))
-
-    if 'show' in show_bands:
-        min_max_stats = pd.read_json(io.StringIO(min_max_data_json), orient='split')
-        # Incumbent cost min/max bands
-        fig.add_trace(go.Scatter(
-            x=min_max_stats['iteration'],
-            y=min_max_stats['incumbent_cost_min'],
-            mode='lines',
-            name='Incumbent Cost (Min)',
-            line=dict(width=0),
-            showlegend=False,
-            legendgroup='incumbent_cost',
-            hovertemplate='%{y:,.0f}<extra></extra>'
-        ))
-        fig.add_trace(go.Scatter(
-            x=min_max_stats['iteration'],
-            y=min_max_stats['incumbent_cost_max'],
+        showlegend=True,
+        colorscale='Greens',
+        showscale=False,
+        opacity=0.4,
+        hoverinfo='skip'
+    )]
+
+    min_max_stats = load_min_max(selected_prefix) if 'show' in show_bands else None
+    if min_max_stats is not None:
+        x, y = _band_xy(min_max_stats, x_range)
+        traces.append(go.Scattergl(
+            x=x,
+            y=y,
             mode='lines',
-            name='Incumbent Cost (Max)',
+            name='Incumbent Cost (Min/Max)',
             line=dict(width=0),
-            fill='tonexty',
+            fill='toself',
             legendgroup='incumbent_cost',
             fillcolor='rgba(242, 128, 137, 0.5)',
             showlegend=False,
-            hovertemplate='%{y:,.0f}<extra></extra>'
+            hoverinfo='skip'
         ))
 
-    fig.add_trace(go.Scatter(
-        x=df_run['iteration'],
-        y=df_run['incumbent_cost'],
-        mode='lines',
-        name='Incumbent Cost',
-        legendgroup='incumbent_cost',
-        line=dict(color=palette[0]),
-        hovertemplate='%{y:,.0f}<extra></extra>'
-    ))
-    fig.add_trace(go.Scatter(
-        x=df_run['iteration'],
-        y=df_run['best_cost'],
-        mode='lines',
-        name='Best Cost',
-        legendgroup='best_cost',
-        line=dict(color=palette[2]),
-        hovertemplate='%{y:,.0f}<extra></extra>'
-    ))
-
-    # Right y-axis
-    if 'candidate_seen' in df_run.columns:
-        fig.add_trace(go.Scatter(
-            x=df_run['iteration'],
-            y=df_run['candidate_seen'],
-            mode='lines',
-            name='Seen',
-            yaxis='y2',
-            line=dict(color=palette[1]),
-            opacity=0.3,
-            hovertemplate='%{y:,.0f}<extra></extra>'
-        ))
-
-    if 'evaluations' in df_run.columns:
-        fig.add_trace(go.Scatter(
-            x=df_run['iteration'],
-            y=df_run['evaluations'],
-            mode='lines',
-            name='Evaluations',
-            yaxis='y2',  # Secondary y-axis
-            line=dict(color=palette[2]),
-            opacity=0.3,
-            hovertemplate='%{y:,.0f}<extra></extra>'
-        ))
+    traces += [_line_trace(df_run, spec, x_range) for spec in line_traces if spec['column'] in df_run.columns]
 
     # Define both primary and secondary y-axes
     yaxis2_config = dict(
@@ -248,9 +508,11 @@ def update_plot(selected_prefix, selected_run, show_bands, relayout_data, min_ma
         showgrid=False,
     )
 
-    yaxis2_config['range'] = [0, max(300, max(df_run['evaluations']), max(df_run['candidate_seen']))]
+    evaluations_max = df_run['evaluations'].to_numpy().max() if 'evaluations' in df_run.columns else 0
+    seen_max = df_run['candidate_seen'].to_numpy().max() if 'candidate_seen' in df_run.columns else 0
+    yaxis2_config['range'] = [0, int(max(300, evaluations_max, seen_max))]
 
-    fig.update_layout(
+    layout = go.Layout(
         title_text=f"Metrics for {selected_prefix}, run {selected_run}",
         xaxis_title="Iteration",
         yaxis=dict(
@@ -258,6 +520,8 @@ def update_plot(selected_prefix, selected_run, show_bands, relayout_data, min_ma
         ),
         yaxis2=yaxis2_config,
         hovermode='x unified',
+        # Keeps the user's pan/zoom in the browser while switching runs or bands for the same instance
+        uirevision=selected_prefix,
         legend=dict(
             orientation="h",
             yanchor="bottom",
@@ -267,21 +531,43 @@ def update_plot(selected_prefix, selected_run, show_bands, relayout_data, min_ma
         )
     )
 
-    # Apply any relayout settings if provided
-    if relayout_data:
-        if 'xaxis.range[0]' in relayout_data and 'xaxis.range[1]' in relayout_data:
-            fig.update_layout(
-                xaxis_range=[relayout_data['xaxis.range[0]'],
-                             relayout_data['xaxis.range[1]']]
-            )
-        if 'yaxis.range[0]' in relayout_data and 'yaxis.range[1]' in relayout_data:
-            fig.update_layout(
-                yaxis_range=[relayout_data['yaxis.range[0]'],
-                             relayout_data['yaxis.range[1]']]
-            )
-
-    return fig
+    return go.Figure(data=traces, layout=layout), x_range
+
+# Callback to redraw the line traces at full resolution for the zoomed x window. Only the trace
+# data is patched, so panning and zooming do not rebuild or re-send the rest of the figure.
+@app.callback(
+    Output('metric-plot', 'figure', allow_duplicate=True),
+    Output('plot-window', 'data', allow_duplicate=True),
+    Input('metric-plot', 'relayoutData'),
+    State('file-prefix-dropdown', 'value'),
+    State('run-slider', 'value'),
+    State('show-bands-checklist', 'value'),
+    prevent_initial_call=True
+)
+def update_window(relayout_data, selected_prefix, selected_run, show_bands):
+    changed, x_range = _relayout_x_range(relayout_data)
+    data = load_data(selected_prefix)
+    if not changed or data is None:
+        raise PreventUpdate
+
+    _, run_groups = data
+    df_run = run_groups.get(selected_run)
+    if df_run is None:
+        raise PreventUpdate
+
+    # Trace order matches update_plot: the candidate heatmap, the band if shown, then line_traces
+    series = []
+    min_max_stats = load_min_max(selected_prefix) if 'show' in show_bands else None
+    if min_max_stats is not None:
+        series.append(_band_xy(min_max_stats, x_range))
+    series += [_downsample(df_run['iteration'], df_run[spec['column']], x_range)
+               for spec in line_traces if spec['column'] in df_run.columns]
 
+    patch = Patch()
+    for index, (x, y) in enumerate(series, start=1):
+        patch['data'][index]['x'] = x
+        patch['data'][index]['y'] = y
+    return patch, x_range
 
 if __name__ == '__main__':
     app.run(debug=True)
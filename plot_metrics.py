@@ -4,6 +4,8 @@ import plotly.subplots as sp
 import glob
 import plotly.io as pio
 
+pio.json.config.default_engine = "orjson"
+
 def plot_metrics(input_file_prefix: str):
     """
     Reads Parquet files, calculates statistics, and generates interactive Plotly plots.
@@ -42,6 +44,8 @@ def plot_metrics(input_file_prefix: str):
     # Flatten the multi-level column index
     stats.columns = ['_'.join(col).strip() for col in stats.columns.values]
     stats = stats.reset_index()
+    # Single precision is plenty for plotting and halves the size of the embedded arrays
+    stats = stats.astype({column: 'float32' for column in stats.select_dtypes('float64').columns})
 
     fig = sp.make_subplots(rows=4, cols=1,
                            subplot_titles=(f'Current and Best cost',
@@ -52,92 +56,92 @@ def plot_metrics(input_file_prefix: str):
 
 
     # Current Cost
-    fig.add_trace(go.Scatter(x=stats['iteration'], y=stats['current_cost_mean'],
-                             mode='lines', name='Current Cost',
-                             line=dict(color='blue'), legendgroup='current_cost',
-                             hovertemplate='%{y:,.0f}<extra></extra>'), row=1, col=1)
-    fig.add_trace(go.Scatter(x=stats['iteration'], y=stats['current_cost_min'],
-                             mode='lines', name='Current Cost (Min)',
-                             line=dict(width=0), showlegend=False, legendgroup='current_cost',
-                             hovertemplate='%{y:,.0f}<extra></extra>'), row=1, col=1)
-    fig.add_trace(go.Scatter(x=stats['iteration'], y=stats['current_cost_max'],
-                             mode='lines', name='Current Cost (Max)',
-                             line=dict(width=0), fill='tonexty', legendgroup='current_cost',
-                             fillcolor='rgba(0,0,255,0.2)', showlegend=False,
-                             hovertemplate='%{y:,.0f}<extra></extra>'), row=1, col=1)
+    fig.add_trace(go.Scattergl(x=stats['iteration'], y=stats['current_cost_mean'],
+                               mode='lines', name='Current Cost',
+                               line=dict(color='blue'), legendgroup='current_cost',
+                               hovertemplate='%{y:,.0f}<extra></extra>'), row=1, col=1)
+    fig.add_trace(go.Scattergl(x=stats['iteration'], y=stats['current_cost_min'],
+                               mode='lines', name='Current Cost (Min)',
+                               line=dict(width=0), showlegend=False, legendgroup='current_cost',
+                               hovertemplate='%{y:,.0f}<extra></extra>'), row=1, col=1)
+    fig.add_trace(go.Scattergl(x=stats['iteration'], y=stats['current_cost_max'],
+                               mode='lines', name='Current Cost (Max)',
+                               line=dict(width=0), fill='tonexty', legendgroup='current_cost',
+                               fillcolor='rgba(0,0,255,0.2)', showlegend=False,
+                               hovertemplate='%{y:,.0f}<extra></extra>'), row=1, col=1)
 
     # Best Cost
-    fig.add_trace(go.Scatter(x=stats['iteration'], y=stats['best_cost_mean'],
-                             mode='lines', name='Best Cost',
-                             line=dict(color='green'), legendgroup='best_cost',
-                             hovertemplate='%{y:,.0f}<extra></extra>'), row=1, col=1)
-    fig.add_trace(go.Scatter(x=stats['iteration'], y=stats['best_cost_min'],
-                             mode='lines', name='Best Cost (Min)',
-                             line=dict(width=0), showlegend=False, legendgroup='best_cost',
-                             hovertemplate='%{y:,.0f}<extra></extra>'), row=1, col=1)
-    fig.add_trace(go.Scatter(x=stats['iteration'], y=stats['best_cost_max'],
-                             mode='lines', name='Best Cost (Max)',
-                             line=dict(width=0), fill='tonexty', legendgroup='best_cost',
-                             fillcolor='rgba(0,255,0,0.2)', showlegend=False,
-                             hovertemplate='%{y:,.0f}<extra></extra>'), row=1, col=1)
+    fig.add_trace(go.Scattergl(x=stats['iteration'], y=stats['best_cost_mean'],
+                               mode='lines', name='Best Cost',
+                               line=dict(color='green'), legendgroup='best_cost',
+                               hovertemplate='%{y:,.0f}<extra></extra>'), row=1, col=1)
+    fig.add_trace(go.Scattergl(x=stats['iteration'], y=stats['best_cost_min'],
+                               mode='lines', name='Best Cost (Min)',
+                               line=dict(width=0), showlegend=False, legendgroup='best_cost',
+                               hovertemplate='%{y:,.0f}<extra></extra>'), row=1, col=1)
+    fig.add_trace(go.Scattergl(x=stats['iteration'], y=stats['best_cost_max'],
+                               mode='lines', name='Best Cost (Max)',
+                               line=dict(width=0), fill='tonexty', legendgroup='best_cost',
+                               fillcolor='rgba(0,255,0,0.2)', showlegend=False,
+                               hovertemplate='%{y:,.0f}<extra></extra>'), row=1, col=1)
 
     fig.update_yaxes(title_text="Cost", row=1, col=1, tickformat=",")
 
 
 
     # Evaluations
-    fig.add_trace(go.Scatter(x=stats['iteration'], y=stats['evaluations_mean'],
-                             mode='lines', name='Evaluations',
-                             line=dict(color='blue'), legendgroup='evaluations',
-                             hovertemplate='Ev. avg.: %{y:,.0f}<extra></extra>'), row=2, col=1)
-    fig.add_trace(go.Scatter(x=stats['iteration'], y=stats['evaluations_min'],
-                             mode='lines', name='Evaluations (Min)',
-                             line=dict(width=0), showlegend=False, legendgroup='evaluations',
-                             hovertemplate='Ev. min.: %{y:,.0f}<extra></extra>'), row=2, col=1)
-    fig.add_trace(go.Scatter(x=stats['iteration'], y=stats['evaluations_max'],
-                             mode='lines', name='Evaluations (Max)',
-                             line=dict(width=0), fill='tonexty', legendgroup='evaluations',
-                             fillcolor='rgba(0,0,255,0.2)', showlegend=False,
-                             hovertemplate='Ev. max.: %{y:,.0f}<extra></extra>'), row=2, col=1)
+    fig.add_trace(go.Scattergl(x=stats['iteration'], y=stats['evaluations_mean'],
+                               mode='lines', name='Evaluations',
+                               line=dict(color='blue'), legendgroup='evaluations',
+                               hovertemplate='Ev. avg.: %{y:,.0f}<extra></extra>'), row=2, col=1)
+    fig.add_trace(go.Scattergl(x=stats['iteration'], y=stats['evaluations_min'],
+                               mode='lines', name='Evaluations (Min)',
+                               line=dict(width=0), showlegend=False, legendgroup='evaluations',
+                               hovertemplate='Ev. min.: %{y:,.0f}<extra></extra>'), row=2, col=1)
+    fig.add_trace(go.Scattergl(x=stats['iteration'], y=stats['evaluations_max'],
+                               mode='lines', name='Evaluations (Max)',
+                               line=dict(width=0), fill='tonexty', legendgroup='evaluations',
+                               fillcolor='rgba(0,0,255,0.2)', showlegend=False,
+                               hovertemplate='Ev. max.: %{y:,.0f}<extra></extra>'), row=2, col=1)
 
     # Infeasible Count
-    fig.add_trace(go.Scatter(x=stats['iteration'], y=stats['infeasible_count_mean'],
-                             mode='lines', name='Infeasible Count',
-                             line=dict(color='red'), legendgroup='infeasible_count',
-                             hovertemplate='In. avg.: %{y:,.0f}<extra></extra>'), row=2, col=1)
-    fig.add_trace(go.Scatter(x=stats['iteration'], y=stats['infeasible_count_min'],
-                             mode='lines', name='Infeasible Count (Min)',
-                             line=dict(width=0), showlegend=False, legendgroup='infeasible_count',
-                             hovertemplate='In. min.: %{y:,.0f}<extra></extra>'), row=2, col=1)
-    fig.add_trace(go.Scatter(x=stats['iteration'], y=stats['infeasible_count_max'],
-                             mode='lines', name='Infeasible Count (Max)',
-                             line=dict(width=0), fill='tonexty', legendgroup='infeasible_count',
-                             fillcolor='rgba(255,0,0,0.2)', showlegend=False,
-                             hovertemplate='In. max.: %{y:,.0f}<extra></extra>'), row=2, col=1)
+    fig.add_trace(go.Scattergl(x=stats['iteration'], y=stats['infeasible_count_mean'],
+                               mode='lines', name='Infeasible Count',
+                               line=dict(color='red'), legendgroup='infeasible_count',
+                               hovertemplate='In. avg.: %{y:,.0f}<extra></extra>'), row=2, col=1)
+    fig.add_trace(go.Scattergl(x=stats['iteration'], y=stats['infeasible_count_min'],
+                               mode='lines', name='Infeasible Count (Min)',
+                               line=dict(width=0), showlegend=False, legendgroup='infeasible_count',
+                               hovertemplate='In. min.: %{y:,.0f}<extra></extra>'), row=2, col=1)
+    fig.add_trace(go.Scattergl(x=stats['iteration'], y=stats['infeasible_count_max'],
+                               mode='lines', name='Infeasible Count (Max)',
+                               line=dict(width=0), fill='tonexty', legendgroup='infeasible_count',
+                               fillcolor='rgba(255,0,0,0.2)', showlegend=False,
+                               hovertemplate='In. max.: %{y:,.0f}<extra></extra>'), row=2, col=1)
 
     fig.update_yaxes(title_text="Count", row=2, col=1, tickformat=",")
 
     # Time
-    fig.add_trace(go.Scatter(x=stats['iteration'], y=stats['time_mean'] * 1_000_000,
-                             mode='lines', name='Time', legendgroup='time',
-                             line=dict(color='purple'),
-                             hovertemplate='Mean: %{y:,.0f}<extra></extra>'), row=3, col=1)
-    fig.add_trace(go.Scatter(x=stats['iteration'], y=stats['time_min'] * 1_000_000,
-                             mode='lines', name='Time (Min)', legendgroup='time',
-                             line=dict(width=0), showlegend=False,
-                             hovertemplate='Min: %{y:,.0f}<extra></extra>'), row=3, col=1)
-    fig.add_trace(go.Scatter(x=stats['iteration'], y=stats['time_max'] * 1_000_000,
-                             mode='lines', name='Time (Max)', legendgroup='time',
-                             line=dict(width=0), fill='tonexty',
-                             fillcolor='rgba(128,0,128,0.2)', showlegend=False,
-                             hovertemplate='Max: %{y:,.0f}<extra></extra>'), row=3, col=1)
+    fig.add_trace(go.Scattergl(x=stats['iteration'], y=stats['time_mean'] * 1_000_000,
+                               mode='lines', name='Time', legendgroup='time',
+                               line=dict(color='purple'),
+                               hovertemplate='Mean: %{y:,.0f}<extra></extra>'), row=3, col=1)
+    fig.add_trace(go.Scattergl(x=stats['iteration'], y=stats['time_min'] * 1_000_000,
+                               mode='lines', name='Time (Min)', legendgroup='time',
+                               line=dict(width=0), showlegend=False,
+                               hovertemplate='Min: %{y:,.0f}<extra></extra>'), row=3, col=1)
+    fig.add_trace(go.Scattergl(x=stats['iteration'], y=stats['time_max'] * 1_000_000,
+                               mode='lines', name='Time (Max)', legendgroup='time',
+                               line=dict(width=0), fill='tonexty',
+                               fillcolor='rgba(128,0,128,0.2)', showlegend=False,
+                               hovertemplate='Max: %{y:,.0f}<extra></extra>'), row=3, col=1)
 
     fig.update_yaxes(title_text="Time (μs)", row=3, col=1, tickformat=",")
 
     # Temperature
-    fig.add_trace(go.Scatter(x=stats['iteration'], y=stats['temperature_mean'],
-                             mode='lines', name='Temperature',
-                             line=dict(color='orange')), row=4, col=1)
+    fig.add_trace(go.Scattergl(x=stats['iteration'], y=stats['temperature_mean'],
+                               mode='lines', name='Temperature',
+                               line=dict(color='orange')), row=4, col=1)
     fig.update_yaxes(title_text="Temperature", row=4, col=1, tickformat=",")
     fig.update_xaxes(title_text="Iteration", row=4, col=1)
 
@@ -146,7 +150,8 @@ def plot_metrics(input_file_prefix: str):
                       title_text=f"Metrics for {input_file_prefix}",
                       hovermode='x unified')
 
-    pio.write_html(fig, file=f'instrumentation/metrics_{input_file_prefix}.html', auto_open=True)
+    pio.write_html(fig, file=f'instrumentation/metrics_{input_file_prefix}.html',
+                   include_plotlyjs='cdn', full_html=True, validate=False, auto_open=True)
 
 if __name__ == '__main__':
     plot_metrics("Call_300_Vehicle_90")